@@ -0,0 +1,29 @@
+"""
+SWAN Base Module
+
+This module provides the base model shared by SWAN components and subcomponents.
+"""
+
+from typing_extensions import Self
+
+from rompy.core.types import RompyBaseModel
+
+
+class SwanBaseModel(RompyBaseModel):
+    """Base model for SWAN components and subcomponents.
+
+    Adds a `trusted()` constructor to the ROMPY base model so instances can be
+    created from already validated data without running validation again.
+
+    """
+
+    @classmethod
+    def trusted(cls, **data) -> Self:
+        """Construct an instance from trusted data without running validation.
+
+        Only intended for internal use with values that are already valid, such as
+        literal defaults or attributes copied from validated objects. User input
+        must go through the normal constructor so fields and validators are applied.
+
+        """
+        return cls.model_construct(**data)
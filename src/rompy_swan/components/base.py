@@ -13,8 +13,8 @@ from typing import Literal, Optional
 
 from pydantic import ConfigDict, Field
 
-from rompy.core.types import RompyBaseModel
 from rompy.logging import get_logger
+from rompy_swan.base import SwanBaseModel
 
 logger = get_logger(__name__)
 
@@ -52,7 +52,7 @@ def split_string(cmd: str, max_length: int = MAX_LENGTH, spaces: int = 4) -> lis
     return [cmd[:split_index]] + split_string(cmd[split_index + 1 :])
 
 
-class BaseComponent(RompyBaseModel):
+class BaseComponent(SwanBaseModel):
     """Base class for SWAN components.
 
     This class is not intended to be used directly, but to be subclassed by other
@@ -125,7 +125,4 @@ class MultiComponents(BaseComponent):
     components: list = Field(description="The components to render")
 
     def cmd(self) -> list[str]:
-        repr = []
-        for component in self.components:
-            repr += [component.cmd()]
-        return repr
+        return [component.cmd() for component in self.components]
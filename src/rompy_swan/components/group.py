@@ -17,6 +17,7 @@ from rompy_swan.components.output import (
     BLOCKS,
     CURVES,
     FRAME,
+    GRID_SPECIAL_NAMES,
     GROUP,
     ISOLINE,
     NEST,
@@ -611,7 +612,7 @@ class OUTPUT(BaseGroupComponent):
             if isinstance(snames, str):
                 snames = [self.block.sname]
             for sname in snames:
-                if sname not in ["BOTTGRID", "COMPGRID"]:
+                if sname not in GRID_SPECIAL_NAMES:
                     location = self._filter_location(sname)
                     component = location.model_type.upper().split("_")[0]
                     if component not in ["FRAME", "GROUP"]:
@@ -822,4 +823,4 @@ class LOCKUP(BaseComponent):
 
     def cmd(self) -> list:
         """Command file strings for this component."""
-        return self.compute.cmd() + [STOP().render()]
+        return self.compute.cmd() + [STOP.trusted().render()]
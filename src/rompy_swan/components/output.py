@@ -6,9 +6,17 @@ for SWAN model results, including spatial points, curves, and nested grids.
 """
 
 from abc import ABC
+from functools import cache
 from typing import Annotated, Literal, Optional, Union
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import (
+    AfterValidator,
+    Field,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+from typing_extensions import Self
 
 from rompy.logging import get_logger
 from rompy_swan.components.base import BaseComponent, MultiComponents
@@ -21,10 +29,15 @@ from rompy_swan.types import IDLA, BlockOptions
 logger = get_logger(__name__)
 
 
-SPECIAL_NAMES = ["BOTTGRID", "COMPGRID", "BOUNDARY", "BOUND_"]
+SPECIAL_NAMES: frozenset[str] = frozenset(
+    {"BOTTGRID", "COMPGRID", "BOUNDARY", "BOUND_"}
+)
+GRID_SPECIAL_NAMES: frozenset[str] = frozenset({"BOTTGRID", "COMPGRID"})
 
 SNAME_TYPE = Annotated[str, Field(min_length=1, max_length=8)]
 
+TEST_POINTS_TYPE = Annotated[Union[XY, IJ], Field(discriminator="model_type")]
+
 
 # =====================================================================================
 # Locations
@@ -466,11 +479,18 @@ class RAY(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"RAY rname='{self.rname}'"
-        repr += f" xp1={self.xp1} yp1={self.yp1} xq1={self.xq1} yq1={self.yq1}"
-        for npts, xp, yp, xq, yq in zip(self.npts, self.xp, self.yp, self.xq, self.yq):
-            repr += f"\nint={npts} xp={xp} yp={yp} xq={xq} yq={yq}"
-        return repr
+        header = (
+            f"RAY rname='{self.rname}' "
+            f"xp1={self.xp1} yp1={self.yp1} xq1={self.xq1} yq1={self.yq1}"
+        )
+        rows = [header]
+        rows.extend(
+            f"int={npts} xp={xp} yp={yp} xq={xq} yq={yq}"
+            for npts, xp, yp, xq, yq in zip(
+                self.npts, self.xp, self.yp, self.xq, self.yq, strict=True
+            )
+        )
+        return "\n".join(rows)
 
 
 class ISOLINE(BaseLocation):
@@ -560,11 +580,11 @@ class POINTS(BaseLocation):
     model_type: Literal["points", "POINTS"] = Field(
         default="points", description="Model type discriminator"
     )
-    xp: Optional[list[float]] = Field(
+    xp: list[float] = Field(
         description="problem coordinates of the points in the x-direction",
         min_length=1,
     )
-    yp: Optional[list[float]] = Field(
+    yp: list[float] = Field(
         description="problem coordinates of the points in the y-direction",
         min_length=1,
     )
@@ -931,34 +951,33 @@ class QUANTITY(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "QUANTITY"
-        for output in self.output:
-            repr += f" {output.upper()}"
+        parts = ["QUANTITY"]
+        parts.extend(output.upper() for output in self.output)
         if self.short is not None:
-            repr += f" short='{self.short}'"
+            parts.append(f"short='{self.short}'")
         if self.long is not None:
-            repr += f" long='{self.long}'"
+            parts.append(f"long='{self.long}'")
         if self.lexp is not None:
-            repr += f" lexp={self.lexp}"
+            parts.append(f"lexp={self.lexp}")
         if self.hexp is not None:
-            repr += f" hexp={self.hexp}"
+            parts.append(f"hexp={self.hexp}")
         if self.excv is not None:
-            repr += f" excv={self.excv}"
+            parts.append(f"excv={self.excv}")
         if self.power is not None:
-            repr += f" power={self.power}"
+            parts.append(f"power={self.power}")
         if self.ref is not None:
-            repr += f" ref='{self.ref}'"
+            parts.append(f"ref='{self.ref}'")
         if self.fswell is not None:
-            repr += f" fswell={self.fswell}"
+            parts.append(f"fswell={self.fswell}")
         if self.noswll is not None:
-            repr += f" noswll={self.noswll}"
+            parts.append(f"noswll={self.noswll}")
         if self.fmin is not None:
-            repr += f" fmin={self.fmin}"
+            parts.append(f"fmin={self.fmin}")
         if self.fmax is not None:
-            repr += f" fmax={self.fmax}"
+            parts.append(f"fmax={self.fmax}")
         if self.coord is not None:
-            repr += f" {self.coord.upper()}"
-        return repr
+            parts.append(self.coord.upper())
+        return " ".join(parts)
 
 
 class QUANTITIES(BaseComponent):
@@ -1141,14 +1160,14 @@ class BaseWrite(BaseComponent, ABC):
         ),
     )
 
-    @model_validator(mode="after")
-    def validate_special_names(self) -> "BaseWrite":
-        special_names = ("COMPGRID", "BOTTGRID")
-        snames = self.sname if isinstance(self.sname, list) else [self.sname]
-        for sname in snames:
-            if sname in special_names and self.model_type.upper() != "BLOCK":
-                raise ValueError(f"Special name {sname} is only supported with BLOCK")
-        return self
+    @field_validator("sname")
+    @classmethod
+    def validate_special_names(cls, sname: str) -> str:
+        """Ensure grid special names are only used with BLOCK."""
+        model_type = cls.model_fields["model_type"].default
+        if sname in GRID_SPECIAL_NAMES and model_type.upper() != "BLOCK":
+            raise ValueError(f"Special name {sname} is only supported with BLOCK")
+        return sname
 
     @model_validator(mode="after")
     def validate_times(self) -> "BaseWrite":
@@ -1219,8 +1238,8 @@ class BLOCK(BaseWrite):
     model_type: Literal["block", "BLOCK"] = Field(
         default="block", description="Model type discriminator"
     )
-    header: Optional[bool] = Field(
-        default=None,
+    header: bool = Field(
+        default=True,
         description=(
             "Indicate if the output should be written to a file with header lines "
             "(SWAN default: True)"
@@ -1252,6 +1271,14 @@ class BLOCK(BaseWrite):
         ),
     )
 
+    @field_validator("header", mode="before")
+    @classmethod
+    def validate_header(cls, header: Optional[bool]) -> bool:
+        """Read a null header, as dumped when the field was optional, as HEADER."""
+        if header is None:
+            return True
+        return header
+
     @field_validator("idla")
     @classmethod
     def validate_idla(cls, idla: IDLA) -> IDLA:
@@ -1275,23 +1302,17 @@ class BLOCK(BaseWrite):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"BLOCK sname='{self.sname}'"
-        if self.header is not None:
-            repr += f" {self._header}"
-        repr += f" fname='{self.fname}'"
+        sep = "\n" if len(self.output) > 1 else " "
+        parts = [f"BLOCK sname='{self.sname}' {self._header} fname='{self.fname}'"]
         if self.idla is not None:
-            repr += f" LAYOUT idla={self.idla}"
-        for output in self.output:
-            if len(self.output) > 1:
-                repr += "\n"
-            else:
-                repr += " "
-            repr += f"{output.upper()}"
+            parts.append(f" LAYOUT idla={self.idla}")
+        parts.append(sep)
+        parts.append(sep.join(output.upper() for output in self.output))
         if self.unit is not None:
-            repr += f"\nunit={self.unit}"
+            parts.append(f"\nunit={self.unit}")
         if self.times is not None:
-            repr += f"\nOUTPUT {self.times.render()}"
-        return repr
+            parts.append(f"\nOUTPUT {self.times.render()}")
+        return "".join(parts)
 
 
 class BLOCKS(MultiComponents):
@@ -1326,6 +1347,25 @@ class BLOCKS(MultiComponents):
     )
     components: list[BLOCK] = Field(description="BLOCK components")
 
+    @classmethod
+    def from_trusted(cls, components: list[BLOCK]) -> Self:
+        """Construct from already validated BLOCK components without validation.
+
+        Parameters
+        ----------
+        components: list[BLOCK]
+            BLOCK instances previously created through pydantic validation, e.g.
+            the components of another BLOCKS object. Raw dicts or unvalidated
+            objects must go through the normal constructor instead.
+
+        Returns
+        -------
+        blocks: BLOCKS
+            BLOCKS instance wrapping the given components.
+
+        """
+        return cls.trusted(components=list(components), model_type="blocks")
+
     @property
     def sname(self) -> list[str]:
         return [component.sname for component in self.components]
@@ -1404,12 +1444,8 @@ class TABLE(BaseWrite):
         if self.format is not None:
             repr += f" {self.format.upper()}"
         repr += f" fname='{self.fname}'"
-        for output in self.output:
-            if len(self.output) > 1:
-                repr += "\n"
-            else:
-                repr += " "
-            repr += f"{output.upper()}"
+        sep = "\n" if len(self.output) > 1 else " "
+        repr += sep + sep.join(output.upper() for output in self.output)
         if self.times is not None:
             repr += f"\nOUTPUT {self.times.render()}"
         return repr
@@ -1545,10 +1581,10 @@ class NESTOUT(BaseWrite):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"NESTOUT sname='{self.sname}' fname='{self.fname}'"
+        parts = [f"NESTOUT sname='{self.sname}' fname='{self.fname}'"]
         if self.times is not None:
-            repr += f" OUTPUT {self.times.render()}"
-        return repr
+            parts.append(f"OUTPUT {self.times.render()}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -1700,13 +1736,8 @@ class TEST(BaseComponent):
             "first `itrace` entries of each subroutine (SWAN default: 0)"
         ),
     )
-    points: Union[XY, IJ] = Field(
+    points: TEST_POINTS_TYPE = Field(
         description="Points where detailed print output is produced (max of 50 points)",
-        discriminator="model_type",
-    )
-    fname_par: Optional[str] = Field(
-        default=None,
-        description="Name of the file where the integral parameters are written to",
     )
     fname_par: Optional[str] = Field(
         default=None,
@@ -1734,10 +1765,33 @@ class TEST(BaseComponent):
             raise ValueError(f"Maximum of 50 points allowed in TEST, got {points.size}")
         return points
 
+    @classmethod
+    def parse_points(cls, data: Union[dict, XY, IJ]) -> Union[XY, IJ]:
+        """Validate points data for TEST using a shared TypeAdapter.
+
+        Useful for batch loaders that pre-validate many points definitions before
+        assembling TEST components, avoiding the construction of a TEST instance
+        just to validate the points. The adapter is built on first use and applies
+        the same checks as the `points` field, raising a `ValidationError` if they
+        fail.
+
+        Parameters
+        ----------
+        data: Union[dict, XY, IJ]
+            Points definition with a `model_type` discriminator of `xy` or `ij`.
+
+        Returns
+        -------
+        points: Union[XY, IJ]
+            The validated points subcomponent.
+
+        """
+        return _test_points_adapter().validate_python(data)
+
     @model_validator(mode="after")
     def at_least_one(self) -> "TEST":
         """Warns if no test file is being specified."""
-        if all(v is None for v in [self.fname_par, self.fname_s1d, self.fname_s2d]):
+        if self.fname_par is None and self.fname_s1d is None and self.fname_s2d is None:
             logger.warning(
                 "TEST command prescribed with no output files, please ensure at least "
                 "one of ()`fname_par`, `fname_s1d` or `fname_s2d`) is specified"
@@ -1746,16 +1800,24 @@ class TEST(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "TEST"
+        parts = ["TEST"]
         if self.itest is not None:
-            repr += f" itest={self.itest}"
+            parts.append(f" itest={self.itest}")
         if self.itrace is not None:
-            repr += f" itrace={self.itrace}"
-        repr += f" POINTS {self.points.model_type.upper()}{self.points.render()}"
+            parts.append(f" itrace={self.itrace}")
+        parts.append(f" POINTS {self.points._MODEL_TYPE_UPPER}{self.points.render()}")
         if self.fname_par is not None:
-            repr += f"PAR fname='{self.fname_par}' "
+            parts.append(f"PAR fname='{self.fname_par}' ")
         if self.fname_s1d is not None:
-            repr += f"S1D fname='{self.fname_s1d}' "
+            parts.append(f"S1D fname='{self.fname_s1d}' ")
         if self.fname_s2d is not None:
-            repr += f"S2D fname='{self.fname_s2d}' "
-        return repr.rstrip()
+            parts.append(f"S2D fname='{self.fname_s2d}' ")
+        return "".join(parts).rstrip()
+
+
+@cache
+def _test_points_adapter() -> TypeAdapter:
+    """TypeAdapter for TEST points, built on the first call to `TEST.parse_points`."""
+    return TypeAdapter(
+        Annotated[TEST_POINTS_TYPE, AfterValidator(TEST.validate_points)]
+    )
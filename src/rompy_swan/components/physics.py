@@ -5,9 +5,10 @@ This module contains components for configuring the physical processes in SWAN,
 including wind generation, whitecapping, quadruplet interactions, and wave breaking.
 """
 
-from typing import Annotated, Any, Literal, Optional, Union
+from typing import Annotated, Any, ClassVar, Literal, Optional, Union
 
 from pydantic import Field, ValidationInfo, field_validator, model_validator
+from typing_extensions import Self
 
 from rompy.logging import get_logger
 from rompy_swan.components.base import BaseComponent
@@ -136,26 +137,34 @@ class GEN1(BaseComponent):
         ),
     )
 
-    def cmd(self):
-        """Command line string for this component."""
-        repr = "GEN1"
+    def _growth_tokens(self, parts: list[str]) -> None:
+        """Append the wave growth and dissipation coefficients cf10 to cf40."""
         if self.cf10 is not None:
-            repr += f" cf10={self.cf10}"
+            parts.append(f"cf10={self.cf10}")
         if self.cf20 is not None:
-            repr += f" cf20={self.cf20}"
+            parts.append(f"cf20={self.cf20}")
         if self.cf30 is not None:
-            repr += f" cf30={self.cf30}"
+            parts.append(f"cf30={self.cf30}")
         if self.cf40 is not None:
-            repr += f" cf40={self.cf40}"
+            parts.append(f"cf40={self.cf40}")
+
+    def _wind_tokens(self, parts: list[str]) -> None:
+        """Append the limit spectrum and wind coefficients edmlpm to cfpm."""
         if self.edmlpm is not None:
-            repr += f" edmlpm={self.edmlpm}"
+            parts.append(f"edmlpm={self.edmlpm}")
         if self.cdrag is not None:
-            repr += f" cdrag={self.cdrag}"
+            parts.append(f"cdrag={self.cdrag}")
         if self.umin is not None:
-            repr += f" umin={self.umin}"
+            parts.append(f"umin={self.umin}")
         if self.cfpm is not None:
-            repr += f" cfpm={self.cfpm}"
-        return repr
+            parts.append(f"cfpm={self.cfpm}")
+
+    def cmd(self):
+        """Command line string for this component."""
+        parts = ["GEN1"]
+        self._growth_tokens(parts)
+        self._wind_tokens(parts)
+        return " ".join(parts)
 
 
 class GEN2(GEN1):
@@ -214,28 +223,14 @@ class GEN2(GEN1):
 
     def cmd(self):
         """Command line string for this component."""
-        repr = "GEN2"
-        if self.cf10 is not None:
-            repr += f" cf10={self.cf10}"
-        if self.cf20 is not None:
-            repr += f" cf20={self.cf20}"
-        if self.cf30 is not None:
-            repr += f" cf30={self.cf30}"
-        if self.cf40 is not None:
-            repr += f" cf40={self.cf40}"
+        parts = ["GEN2"]
+        self._growth_tokens(parts)
         if self.cf50 is not None:
-            repr += f" cf50={self.cf50}"
+            parts.append(f"cf50={self.cf50}")
         if self.cf60 is not None:
-            repr += f" cf60={self.cf60}"
-        if self.edmlpm is not None:
-            repr += f" edmlpm={self.edmlpm}"
-        if self.cdrag is not None:
-            repr += f" cdrag={self.cdrag}"
-        if self.umin is not None:
-            repr += f" umin={self.umin}"
-        if self.cfpm is not None:
-            repr += f" cfpm={self.cfpm}"
-        return repr
+            parts.append(f"cf60={self.cf60}")
+        self._wind_tokens(parts)
+        return " ".join(parts)
 
 
 class GEN3(BaseComponent):
@@ -273,11 +268,32 @@ class GEN3(BaseComponent):
         default="gen3", description="Model type discriminator"
     )
     source_terms: SOURCE_TERMS = Field(
-        default_factory=WESTHUYSEN,
+        default_factory=WESTHUYSEN.trusted,
         description="SWAN source terms to be used (SWAN default: WESTHUYSEN)",
         discriminator="model_type",
     )
 
+    @classmethod
+    def from_trusted(cls, source_terms: SOURCE_TERMS) -> Self:
+        """Construct from an already validated source terms instance.
+
+        The ``model_type`` discriminator on ``source_terms`` is not checked, so the
+        instance must be one of the SOURCE_TERMS subcomponents created through
+        pydantic validation. Raw dicts must go through the normal constructor.
+
+        Parameters
+        ----------
+        source_terms: SOURCE_TERMS
+            Validated source terms subcomponent, e.g. taken from another GEN3.
+
+        Returns
+        -------
+        gen: GEN3
+            GEN3 instance wrapping the given source terms.
+
+        """
+        return cls.trusted(source_terms=source_terms, model_type="gen3")
+
     def cmd(self):
         """Command line string for this component."""
         repr = f"GEN3 {self.source_terms.render()}"
@@ -337,10 +353,10 @@ class NEGATINP(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "NEGATINP"
+        parts = ["NEGATINP"]
         if self.rdcoef is not None:
-            repr += f" rdcoef={self.rdcoef}"
-        return repr
+            parts.append(f"rdcoef={self.rdcoef}")
+        return " ".join(parts)
 
 
 class SSWELL_ROGERS(BaseComponent):
@@ -387,12 +403,12 @@ class SSWELL_ROGERS(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "SSWELL ROGERS"
+        parts = ["SSWELL ROGERS"]
         if self.cdsv is not None:
-            repr += f" cdsv={self.cdsv}"
+            parts.append(f"cdsv={self.cdsv}")
         if self.feswell is not None:
-            repr += f" feswell={self.feswell}"
-        return repr
+            parts.append(f"feswell={self.feswell}")
+        return " ".join(parts)
 
 
 class SSWELL_ARDHUIN(BaseComponent):
@@ -437,10 +453,10 @@ class SSWELL_ARDHUIN(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "SSWELL ARDHUIN"
+        parts = ["SSWELL ARDHUIN"]
         if self.cdsv is not None:
-            repr += f" cdsv={self.cdsv}"
-        return repr
+            parts.append(f"cdsv={self.cdsv}")
+        return " ".join(parts)
 
 
 class SSWELL_ZIEGER(BaseComponent):
@@ -490,10 +506,10 @@ class SSWELL_ZIEGER(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "SSWELL ZIEGER"
+        parts = ["SSWELL ZIEGER"]
         if self.b1 is not None:
-            repr += f" b1={self.b1}"
-        return repr
+            parts.append(f"b1={self.b1}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -744,20 +760,20 @@ class QUADRUPL(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "QUADRUPL"
+        parts = ["QUADRUPL"]
         if self.iquad is not None:
-            repr += f" iquad={self.iquad}"
+            parts.append(f"iquad={self.iquad}")
         if self.lambd is not None:
-            repr += f" lambda={self.lambd}"
+            parts.append(f"lambda={self.lambd}")
         if self.cnl4 is not None:
-            repr += f" cnl4={self.cnl4}"
+            parts.append(f"cnl4={self.cnl4}")
         if self.csh1 is not None:
-            repr += f" csh1={self.csh1}"
+            parts.append(f"csh1={self.csh1}")
         if self.csh2 is not None:
-            repr += f" csh2={self.csh2}"
+            parts.append(f"csh2={self.csh2}")
         if self.csh3 is not None:
-            repr += f" csh3={self.csh3}"
-        return repr
+            parts.append(f"csh3={self.csh3}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -806,12 +822,12 @@ class BREAKING_CONSTANT(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "BREAKING CONSTANT"
+        parts = ["BREAKING CONSTANT"]
         if self.alpha is not None:
-            repr += f" alpha={self.alpha}"
+            parts.append(f"alpha={self.alpha}")
         if self.gamma is not None:
-            repr += f" gamma={self.gamma}"
-        return repr
+            parts.append(f"gamma={self.gamma}")
+        return " ".join(parts)
 
 
 class BREAKING_BKD(BaseComponent):
@@ -873,18 +889,18 @@ class BREAKING_BKD(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "BREAKING BKD"
+        parts = ["BREAKING BKD"]
         if self.alpha is not None:
-            repr += f" alpha={self.alpha}"
+            parts.append(f"alpha={self.alpha}")
         if self.gamma0 is not None:
-            repr += f" gamma0={self.gamma0}"
+            parts.append(f"gamma0={self.gamma0}")
         if self.a1 is not None:
-            repr += f" a1={self.a1}"
+            parts.append(f"a1={self.a1}")
         if self.a2 is not None:
-            repr += f" a2={self.a2}"
+            parts.append(f"a2={self.a2}")
         if self.a3 is not None:
-            repr += f" a3={self.a3}"
-        return repr
+            parts.append(f"a3={self.a3}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -935,10 +951,10 @@ class FRICTION_JONSWAP(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "FRICTION JONSWAP CONSTANT"
+        parts = ["FRICTION JONSWAP CONSTANT"]
         if self.cfjon is not None:
-            repr += f" cfjon={self.cfjon}"
-        return repr
+            parts.append(f"cfjon={self.cfjon}")
+        return " ".join(parts)
 
 
 class FRICTION_COLLINS(BaseComponent):
@@ -983,10 +999,10 @@ class FRICTION_COLLINS(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "FRICTION COLLINS"
+        parts = ["FRICTION COLLINS"]
         if self.cfw is not None:
-            repr += f" cfw={self.cfw}"
-        return repr
+            parts.append(f"cfw={self.cfw}")
+        return " ".join(parts)
 
 
 class FRICTION_MADSEN(BaseComponent):
@@ -1037,10 +1053,10 @@ class FRICTION_MADSEN(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "FRICTION MADSEN"
+        parts = ["FRICTION MADSEN"]
         if self.kn is not None:
-            repr += f" kn={self.kn}"
-        return repr
+            parts.append(f"kn={self.kn}")
+        return " ".join(parts)
 
 
 class FRICTION_RIPPLES(BaseComponent):
@@ -1087,12 +1103,12 @@ class FRICTION_RIPPLES(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "FRICTION RIPPLES"
+        parts = ["FRICTION RIPPLES"]
         if self.s is not None:
-            repr += f" S={self.s}"
+            parts.append(f"S={self.s}")
         if self.d is not None:
-            repr += f" D={self.d}"
-        return repr
+            parts.append(f"D={self.d}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -1653,14 +1669,14 @@ class MUD(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "MUD"
+        parts = ["MUD"]
         if self.layer is not None:
-            repr += f" layer={self.layer}"
+            parts.append(f"layer={self.layer}")
         if self.rhom is not None:
-            repr += f" rhom={self.rhom}"
+            parts.append(f"rhom={self.rhom}")
         if self.viscm is not None:
-            repr += f" viscm={self.viscm}"
-        return repr
+            parts.append(f"viscm={self.viscm}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -1735,12 +1751,16 @@ class SICE(BaseComponent):
         le=1.0,
     )
 
+    def _cmd_tokens(self) -> list[str]:
+        """Command tokens shared by SICE and its method subclasses."""
+        parts = ["SICE"]
+        if self.aice is not None:
+            parts.append(f"aice={self.aice}")
+        return parts
+
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "SICE"
-        if self.aice is not None:
-            repr += f" aice={self.aice}"
-        return repr
+        return " ".join(self._cmd_tokens())
 
 
 class SICE_R19(SICE):
@@ -1842,24 +1862,27 @@ class SICE_R19(SICE):
         ),
     )
 
+    _MODEL_TYPE_UPPER: ClassVar[str] = "R19"
+
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"{super().cmd()} {self.model_type.upper()}"
+        parts = self._cmd_tokens()
+        parts.append(self._MODEL_TYPE_UPPER)
         if self.c0 is not None:
-            repr += f" c0={self.c0}"
+            parts.append(f"c0={self.c0}")
         if self.c1 is not None:
-            repr += f" c1={self.c1}"
+            parts.append(f"c1={self.c1}")
         if self.c2 is not None:
-            repr += f" c2={self.c2}"
+            parts.append(f"c2={self.c2}")
         if self.c3 is not None:
-            repr += f" c3={self.c3}"
+            parts.append(f"c3={self.c3}")
         if self.c4 is not None:
-            repr += f" c4={self.c4}"
+            parts.append(f"c4={self.c4}")
         if self.c5 is not None:
-            repr += f" c5={self.c5}"
+            parts.append(f"c5={self.c5}")
         if self.c6 is not None:
-            repr += f" c6={self.c6}"
-        return repr
+            parts.append(f"c6={self.c6}")
+        return " ".join(parts)
 
 
 class SICE_D15(SICE):
@@ -1897,12 +1920,15 @@ class SICE_D15(SICE):
         description="A simple coefficient of proportionality (SWAN default: 0.1)",
     )
 
+    _MODEL_TYPE_UPPER: ClassVar[str] = "D15"
+
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"{super().cmd()} {self.model_type.upper()}"
+        parts = self._cmd_tokens()
+        parts.append(self._MODEL_TYPE_UPPER)
         if self.chf is not None:
-            repr += f" chf={self.chf}"
-        return repr
+            parts.append(f"chf={self.chf}")
+        return " ".join(parts)
 
 
 class SICE_M18(SICE):
@@ -1940,12 +1966,15 @@ class SICE_M18(SICE):
         description="A simple coefficient of proportionality (SWAN default: 0.059)",
     )
 
+    _MODEL_TYPE_UPPER: ClassVar[str] = "M18"
+
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"{super().cmd()} {self.model_type.upper()}"
+        parts = self._cmd_tokens()
+        parts.append(self._MODEL_TYPE_UPPER)
         if self.chf is not None:
-            repr += f" chf={self.chf}"
-        return repr
+            parts.append(f"chf={self.chf}")
+        return " ".join(parts)
 
 
 class SICE_R21B(SICE):
@@ -1990,14 +2019,17 @@ class SICE_R21B(SICE):
         ),
     )
 
+    _MODEL_TYPE_UPPER: ClassVar[str] = "R21B"
+
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"{super().cmd()} {self.model_type.upper()}"
+        parts = self._cmd_tokens()
+        parts.append(self._MODEL_TYPE_UPPER)
         if self.chf is not None:
-            repr += f" chf={self.chf}"
+            parts.append(f"chf={self.chf}")
         if self.npf is not None:
-            repr += f" npf={self.npf}"
-        return repr
+            parts.append(f"npf={self.npf}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -2163,16 +2195,19 @@ class BRAGG(BaseComponent):
         ),
     )
 
-    def cmd(self) -> str:
-        """Command file string for this component."""
-        repr = "BRAGG"
+    def _cmd_tokens(self) -> list[str]:
+        """Command tokens shared by all BRAGG variants."""
+        parts = ["BRAGG"]
         if self.ibrag is not None:
-            repr += f" ibrag={self.ibrag}"
-        if self.nreg is not None:
-            repr += f" nreg={self.nreg}"
+            parts.append(f"ibrag={self.ibrag}")
+        parts.append(f"nreg={self.nreg}")
         if self.cutoff is not None:
-            repr += f" cutoff={self.cutoff}"
-        return repr
+            parts.append(f"cutoff={self.cutoff}")
+        return parts
+
+    def cmd(self) -> str:
+        """Command file string for this component."""
+        return " ".join(self._cmd_tokens())
 
 
 class BRAGG_FT(BRAGG):
@@ -2210,7 +2245,9 @@ class BRAGG_FT(BRAGG):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        return f"{super().cmd()} FT"
+        parts = self._cmd_tokens()
+        parts.append("FT")
+        return " ".join(parts)
 
 
 class BRAGG_FILE(BRAGG):
@@ -2291,16 +2328,17 @@ class BRAGG_FILE(BRAGG):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"{super().cmd()} FILE fname='{self.fname}'"
+        parts = self._cmd_tokens()
+        parts.append(f"FILE fname='{self.fname}'")
         if self.idla is not None:
-            repr += f" idla={self.idla.value}"
-        repr += f" mkx={self.mkx}"
+            parts.append(f"idla={self.idla.value}")
+        parts.append(f"mkx={self.mkx}")
         if self.mky is not None:
-            repr += f" mky={self.mky}"
-        repr += f" dkx={self.dkx}"
+            parts.append(f"mky={self.mky}")
+        parts.append(f"dkx={self.dkx}")
         if self.dky is not None:
-            repr += f" dky={self.dky}"
-        return repr
+            parts.append(f"dky={self.dky}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -2346,12 +2384,12 @@ class LIMITER(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "LIMITER"
+        parts = ["LIMITER"]
         if self.ursell is not None:
-            repr += f" ursell={self.ursell}"
+            parts.append(f"ursell={self.ursell}")
         if self.qb is not None:
-            repr += f" qb={self.qb}"
-        return repr
+            parts.append(f"qb={self.qb}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -2420,28 +2458,32 @@ class OBSTACLE(BaseComponent):
     freeboard: Optional[FREEBOARD] = Field(default=None, description="Freeboard")
     line: LINE = Field(default=None, description="Line of obstacle")
 
+    _DAM_MODEL_TYPES: ClassVar[frozenset[str]] = frozenset(
+        {"goda", "GODA", "dangremond", "DANGREMOND"}
+    )
+
     @model_validator(mode="after")
     def hgt_consistent(self) -> "OBSTACLE":
         """Warns if `hgt` has different values in DAM and FREEBOARD specifications."""
         if self.transmission is not None and self.freeboard is not None:
-            is_dam = self.transmission.model_type.upper() in ["GODA", "DANGREMOND"]
+            is_dam = self.transmission.model_type in self._DAM_MODEL_TYPES
             if is_dam and self.freeboard.hgt != self.transmission.hgt:
                 logger.warning("hgt in FREEBOARD and DAM specifications are not equal")
         return self
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "OBSTACLE"
+        parts = ["OBSTACLE"]
         if self.transmission is not None:
-            repr += f" {self.transmission.render()}"
+            parts.append(self.transmission.render())
         if self.reflection:
-            repr += f" {self.reflection.render()}"
+            parts.append(self.reflection.render())
         if self.reflection_type is not None:
-            repr += f" {self.reflection_type.render()}"
+            parts.append(self.reflection_type.render())
         if self.freeboard is not None:
-            repr += f" {self.freeboard.render()}"
-        repr += f" {self.line.render()}"
-        return repr
+            parts.append(self.freeboard.render())
+        parts.append(self.line.render())
+        return " ".join(parts)
 
 
 class OBSTACLE_FIG(BaseComponent):
@@ -2533,11 +2575,11 @@ class OBSTACLE_FIG(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"OBSTACLE FIG alpha1={self.alpha1} hss={self.hss} tss={self.tss}"
+        parts = [f"OBSTACLE FIG alpha1={self.alpha1} hss={self.hss} tss={self.tss}"]
         if self.reflection:
-            repr += f" {self.reflection.render()}"
-        repr += f" {self.line.render()}"
-        return repr
+            parts.append(self.reflection.render())
+        parts.append(self.line.render())
+        return " ".join(parts)
 
 
 OBSTACLES_TYPE = Annotated[
@@ -2593,17 +2635,12 @@ class OBSTACLES(BaseComponent):
 
     def cmd(self) -> list:
         """Command file strings for this component."""
-        repr = []
-        for obstacle in self.obstacles:
-            repr += [obstacle.cmd()]
-        return repr
+        return [obstacle.cmd() for obstacle in self.obstacles]
 
     def render(self) -> str:
         """Override base class to allow rendering list of components."""
-        cmds = []
-        for cmd in self.cmd():
-            cmds.append(super().render(cmd))
-        return cmds
+        render = super().render
+        return [render(cmd) for cmd in self.cmd()]
 
 
 # =====================================================================================
@@ -2662,10 +2699,10 @@ class SETUP(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "SETUP"
+        parts = ["SETUP"]
         if self.supcor is not None:
-            repr += f" supcor={self.supcor}"
-        return repr
+            parts.append(f"supcor={self.supcor}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -2744,16 +2781,16 @@ class DIFFRACTION(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "DIFFRACTION"
+        parts = ["DIFFRACTION"]
         if self.idiffr is not None:
-            repr += f" idiffr={int(self.idiffr)}"
+            parts.append(f"idiffr={self.idiffr:d}")
         if self.smpar is not None:
-            repr += f" smpar={self.smpar}"
+            parts.append(f"smpar={self.smpar}")
         if self.smnum is not None:
-            repr += f" smnum={self.smnum}"
+            parts.append(f"smnum={self.smnum}")
         if self.cgmod is not None:
-            repr += f" cgmod={self.cgmod}"
-        return repr
+            parts.append(f"cgmod={self.cgmod}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -2829,18 +2866,23 @@ class SURFBEAT(BaseComponent):
         ),
     )
 
+    _SPACINGS: ClassVar[dict[str, str]] = {
+        "uniform": "UNIFORM",
+        "logarithmic": "LOGARITHMIC",
+    }
+
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "SURFBEAT"
+        parts = ["SURFBEAT"]
         if self.df is not None:
-            repr += f" df={self.df}"
+            parts.append(f"df={self.df}")
         if self.nmax is not None:
-            repr += f" nmax={self.nmax}"
+            parts.append(f"nmax={self.nmax}")
         if self.emin is not None:
-            repr += f" emin={self.emin}"
+            parts.append(f"emin={self.emin}")
         if self.spacing is not None:
-            repr += f" {self.spacing.upper()}"
-        return repr
+            parts.append(self._SPACINGS[self.spacing])
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -2941,18 +2983,18 @@ class SCAT(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "SCAT"
+        parts = ["SCAT"]
         if self.iqcm is not None:
-            repr += f" iqcm={self.iqcm}"
+            parts.append(f"iqcm={self.iqcm}")
         if self.rfac is not None:
-            repr += f" GRID rfac={self.rfac}"
+            parts.append(f"GRID rfac={self.rfac}")
         if self.alpha is not None or self.qmax is not None:
-            repr += " TRUNC"
+            parts.append("TRUNC")
             if self.alpha is not None:
-                repr += f" alpha={self.alpha}"
+                parts.append(f"alpha={self.alpha}")
             if self.qmax is not None:
-                repr += f" qmax={self.qmax}"
-        return repr
+                parts.append(f"qmax={self.qmax}")
+        return " ".join(parts)
 
 
 # =====================================================================================
@@ -2985,9 +3027,13 @@ class OFF(BaseComponent):
     )
     physics: PhysicsOff = Field(description="Physics command to be switched off")
 
+    _CMDS: ClassVar[dict[PhysicsOff, str]] = {
+        physics: f"OFF {physics.value.upper()}" for physics in PhysicsOff
+    }
+
     def cmd(self) -> str:
         """Command file string for this component."""
-        return f"OFF {self.physics.value.upper()}"
+        return self._CMDS[self.physics]
 
 
 class OFFS(BaseComponent):
@@ -3024,7 +3070,4 @@ class OFFS(BaseComponent):
 
     def cmd(self) -> list:
         """Command file strings for this component."""
-        repr = []
-        for off in self.offs:
-            repr += [off.cmd()]
-        return repr
+        return [off.cmd() for off in self.offs]
@@ -5,17 +5,17 @@ This module provides the base classes for SWAN subcomponents in the ROMPY framew
 """
 
 from abc import ABC
-from typing import Literal
+from typing import ClassVar, Literal
 
 from pydantic import ConfigDict, Field, model_validator
 
-from rompy.core.types import RompyBaseModel
 from rompy.logging import get_logger
+from rompy_swan.base import SwanBaseModel
 
 logger = get_logger(__name__)
 
 
-class BaseSubComponent(RompyBaseModel, ABC):
+class BaseSubComponent(SwanBaseModel, ABC):
     """Base class for SWAN sub-components.
 
     This class is not intended to be used directly, but to be subclassed by other
@@ -69,6 +69,7 @@ class XY(BaseSubComponent):
         default="xy",
         description="Model type discriminator",
     )
+
     x: list[float] = Field(description="Problem x-coordinate values")
     y: list[float] = Field(description="Problem y-coordinate values")
     fmt: str = Field(
@@ -76,6 +77,8 @@ class XY(BaseSubComponent):
         description="The format to render floats values",
     )
 
+    _MODEL_TYPE_UPPER: ClassVar[str] = "XY"
+
     @model_validator(mode="after")
     def validate_size(self) -> "XY":
         if len(self.x) != len(self.y):
@@ -121,9 +124,12 @@ class IJ(BaseSubComponent):
         default="ij",
         description="Model type discriminator",
     )
+
     i: list[int] = Field(description="i-index values")
     j: list[int] = Field(description="j-index values")
 
+    _MODEL_TYPE_UPPER: ClassVar[str] = "IJ"
+
     @model_validator(mode="after")
     def validate_size(self) -> "IJ":
         if len(self.i) != len(self.j):
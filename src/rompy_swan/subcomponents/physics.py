@@ -1,8 +1,11 @@
 """SWAN physics subcomponents."""
 
+import io
 from abc import ABC
-from typing import Annotated, Literal, Optional
+from itertools import chain
+from typing import Annotated, ClassVar, Literal, Optional
 
+import numpy as np
 from pydantic import Field, field_validator, model_validator
 from pydantic_numpy.typing import Np2DArray
 
@@ -605,7 +608,25 @@ class DEWIT(BaseSubComponent):
 # =====================================================================================
 # Transmission and reflection
 # =====================================================================================
-class TRANSM(BaseSubComponent):
+class KeywordParameter(BaseSubComponent, ABC):
+    """Base class for subcomponents rendered as a keyword and one optional parameter.
+
+    Subclasses set the `_KEYWORD` to render and the name of the `_PARAMETER` field.
+
+    """
+
+    _KEYWORD: ClassVar[str]
+    _PARAMETER: ClassVar[str]
+
+    def cmd(self) -> str:
+        """Command file string for this subcomponent."""
+        value = getattr(self, self._PARAMETER)
+        if value is None:
+            return self._KEYWORD
+        return f"{self._KEYWORD} {self._PARAMETER}={value}"
+
+
+class TRANSM(KeywordParameter):
     """Constant transmission coefficient.
 
     .. code-block:: text
@@ -629,6 +650,7 @@ class TRANSM(BaseSubComponent):
     model_type: Literal["transm", "TRANSM"] = Field(
         default="transm", description="Model type discriminator"
     )
+
     trcoef: Optional[float] = Field(
         default=None,
         description=(
@@ -640,12 +662,8 @@ class TRANSM(BaseSubComponent):
         le=1.0,
     )
 
-    def cmd(self) -> str:
-        """Command file string for this subcomponent."""
-        repr = "TRANSM"
-        if self.trcoef is not None:
-            repr += f" trcoef={self.trcoef}"
-        return repr
+    _KEYWORD: ClassVar[str] = "TRANSM"
+    _PARAMETER: ClassVar[str] = "trcoef"
 
 
 class TRANS1D(BaseSubComponent):
@@ -716,18 +734,17 @@ class TRANS2D(BaseSubComponent):
 
     @field_validator("trcoef")
     @classmethod
-    def constrained_0_1(cls, value: float) -> float:
-        """Ensure all directions have the same number of frequencies."""
+    def constrained_0_1(cls, value: Np2DArray) -> Np2DArray:
+        """Ensure all transmission coefficients are between 0 and 1."""
         if value.min() < 0 or value.max() > 1:
             raise ValueError("Transmission coefficients must be between 0.0 and 1.0")
         return value
 
     def cmd(self) -> str:
         """Command file string for this subcomponent."""
-        repr = "TRANS2D"
-        for coef in self.trcoef:
-            repr += f" &\n\t{' '.join(str(v) for v in coef)}"
-        return f"{repr} &\n\t"
+        buffer = io.StringIO()
+        np.savetxt(buffer, self.trcoef, fmt="%s", delimiter=" ", newline=" &\n\t")
+        return f"TRANS2D &\n\t{buffer.getvalue()}"
 
 
 class GODA(BaseSubComponent):
@@ -766,6 +783,7 @@ class GODA(BaseSubComponent):
     model_type: Literal["goda", "GODA"] = Field(
         default="goda", description="Model type discriminator"
     )
+
     hgt: float = Field(
         description=(
             "The elevation of the top of the obstacle above reference level (same "
@@ -788,14 +806,16 @@ class GODA(BaseSubComponent):
         ),
     )
 
+    _MODEL_TYPE_UPPER: ClassVar[str] = "GODA"
+
     def cmd(self) -> str:
         """Command file string for this subcomponent."""
-        repr = f"DAM {self.model_type.upper()} hgt={self.hgt}"
+        parts = [f"DAM {self._MODEL_TYPE_UPPER} hgt={self.hgt}"]
         if self.alpha is not None:
-            repr += f" alpha={self.alpha}"
+            parts.append(f"alpha={self.alpha}")
         if self.beta is not None:
-            repr += f" beta={self.beta}"
-        return repr
+            parts.append(f"beta={self.beta}")
+        return " ".join(parts)
 
 
 class DANGREMOND(BaseSubComponent):
@@ -828,6 +848,7 @@ class DANGREMOND(BaseSubComponent):
     model_type: Literal["dangremond", "DANGREMOND"] = Field(
         default="dangremond", description="Model type discriminator"
     )
+
     hgt: float = Field(
         description=(
             "The elevation of the top of the obstacle above reference level (same "
@@ -840,14 +861,17 @@ class DANGREMOND(BaseSubComponent):
     )
     Bk: float = Field(description="The crest width of the obstacle")
 
+    _MODEL_TYPE_UPPER: ClassVar[str] = "DANGREMOND"
+
     def cmd(self) -> str:
         """Command file string for this subcomponent."""
-        repr = f"DAM {self.model_type.upper()}"
-        repr += f" hgt={self.hgt} slope={self.slope} Bk={self.Bk}"
-        return repr
+        return (
+            f"DAM {self._MODEL_TYPE_UPPER} "
+            f"hgt={self.hgt} slope={self.slope} Bk={self.Bk}"
+        )
 
 
-class REFL(BaseSubComponent):
+class REFL(KeywordParameter):
     """Obstacle reflections.
 
     .. code-block:: text
@@ -871,6 +895,7 @@ class REFL(BaseSubComponent):
     model_type: Literal["refl", "REFL"] = Field(
         default="refl", description="Model type discriminator"
     )
+
     reflc: Optional[float] = Field(
         default=None,
         description=(
@@ -879,12 +904,8 @@ class REFL(BaseSubComponent):
         ),
     )
 
-    def cmd(self) -> str:
-        """Command file string for this subcomponent."""
-        repr = "REFL"
-        if self.reflc is not None:
-            repr += f" reflc={self.reflc}"
-        return repr
+    _KEYWORD: ClassVar[str] = "REFL"
+    _PARAMETER: ClassVar[str] = "reflc"
 
 
 class RSPEC(BaseSubComponent):
@@ -915,7 +936,7 @@ class RSPEC(BaseSubComponent):
         return "RSPEC"
 
 
-class RDIFF(BaseSubComponent):
+class RDIFF(KeywordParameter):
     """Diffuse reflection.
 
     .. code-block:: text
@@ -941,6 +962,7 @@ class RDIFF(BaseSubComponent):
     model_type: Literal["rdiff", "RDIFF"] = Field(
         default="rdiff", description="Model type discriminator"
     )
+
     pown: Optional[float] = Field(
         default=None,
         description=(
@@ -950,12 +972,8 @@ class RDIFF(BaseSubComponent):
         ),
     )
 
-    def cmd(self) -> str:
-        """Command file string for this subcomponent."""
-        repr = "RDIFF"
-        if self.pown is not None:
-            repr += f" pown={self.pown}"
-        return repr
+    _KEYWORD: ClassVar[str] = "RDIFF"
+    _PARAMETER: ClassVar[str] = "pown"
 
 
 class FREEBOARD(BaseSubComponent):
@@ -1033,16 +1051,14 @@ class FREEBOARD(BaseSubComponent):
 
     def cmd(self) -> str:
         """Command file string for this subcomponent."""
-        repr = "FREEBOARD"
-        if self.hgt is not None:
-            repr += f" hgt={self.hgt}"
+        parts = [f"FREEBOARD hgt={self.hgt}"]
         if self.gammat is not None:
-            repr += f" gammat={self.gammat}"
+            parts.append(f"gammat={self.gammat}")
         if self.gammar is not None:
-            repr += f" gammar={self.gammar}"
+            parts.append(f"gammar={self.gammar}")
         if self.quay:
-            repr += " QUAY"
-        return repr
+            parts.append("QUAY")
+        return " ".join(parts)
 
 
 class LINE(BaseSubComponent):
@@ -1093,7 +1109,5 @@ class LINE(BaseSubComponent):
 
     def cmd(self) -> str:
         """Command file string for this subcomponent."""
-        repr = "LINE"
-        for xp, yp in zip(self.xp, self.yp):
-            repr += f" {xp} {yp}"
-        return repr
+        coords = chain.from_iterable(zip(self.xp, self.yp))
+        return " ".join(["LINE", *map(str, coords)])
@@ -42,6 +42,7 @@ from datetime import datetime, timedelta
 
 from rompy.core.time import TimeRange
 from rompy_swan.interface import OutputInterface
+from rompy_swan.subcomponents.base import IJ
 from rompy_swan.subcomponents.time import TimeRangeOpen
 
 
@@ -238,12 +239,27 @@ def test_sname_lt8():
         BaseLocation(sname="outputlocations")
 
 
-@pytest.mark.parametrize("sname", SPECIAL_NAMES)
+@pytest.mark.parametrize("sname", sorted(SPECIAL_NAMES))
 def test_sname_special(sname):
     with pytest.raises(ValidationError):
         BaseLocation(sname=sname)
 
 
+@pytest.mark.parametrize(
+    "component, kwargs",
+    [(TABLE, dict(output=["hsign"])), (NESTOUT, dict())],
+)
+def test_grid_special_names_only_with_block(component, kwargs):
+    component(sname="outpts", fname="./output.txt", **kwargs)
+    with pytest.raises(ValidationError, match="only supported with BLOCK"):
+        component(sname="COMPGRID", fname="./output.txt", **kwargs)
+
+
+def test_block_grid_special_names():
+    block = BLOCK(sname="COMPGRID", fname="./output.txt", output=["depth"])
+    assert block.sname == "COMPGRID"
+
+
 def test_frame(frame):
     assert frame.render() == (
         "FRAME sname='outgrid' xpfr=173.0 ypfr=-40.0 alpfr=0.0 "
@@ -323,7 +339,36 @@ def test_output_options(output_options):
 
 def test_block():
     block = BLOCK(sname="outgrid", fname="./depth-frame.nc", output=["depth"])
-    block.render() == "BLOCK sname='outgrid' fname='./depth-frame.nc' DEPTH"
+    assert block.render() == (
+        "BLOCK sname='outgrid' HEADER fname='./depth-frame.nc' DEPTH"
+    )
+
+
+def test_block_header_none_roundtrip():
+    # Configs dumped when header was Optional[bool] carry an explicit null
+    data = dict(sname="outgrid", header=None, fname="./out.txt", output=["depth"])
+    block = BLOCK(**data)
+    assert block.header is True
+    assert BLOCK(**block.model_dump()) == block
+
+
+def test_block_layout_unit():
+    block = BLOCK(
+        sname="outgrid",
+        header=False,
+        fname="./output.txt",
+        idla=3,
+        output=["depth", "hsign"],
+        unit=2.0,
+    )
+    assert block.cmd() == (
+        "BLOCK sname='outgrid' NOHEADER fname='./output.txt' LAYOUT idla=3"
+        "\nDEPTH\nHSIGN\nunit=2.0"
+    )
+    assert block.render() == (
+        "BLOCK sname='outgrid' NOHEADER fname='./output.txt' LAYOUT idla=3 &"
+        "\n    DEPTH &\n    HSIGN &\n    unit=2.0"
+    )
 
 
 def test_blocks():
@@ -338,6 +383,15 @@ def test_blocks():
     assert isinstance(blocks.components[0], BLOCK)
 
 
+def test_blocks_from_trusted():
+    block1 = BLOCK(sname="outgrid", fname="./depth.txt", output=["depth"])
+    block2 = BLOCK(sname="outgrid", fname="./output.nc", output=["hsign", "hswell"])
+    blocks = BLOCKS(components=[block1, block2])
+    trusted = BLOCKS.from_trusted(blocks.components)
+    assert trusted.components == blocks.components
+    assert trusted.render() == blocks.render()
+
+
 def test_block_nonstationary(block):
     assert "OUTPUT tbegblk=19900101.000000 deltblk=1.0 HR" in block.render()
 
@@ -377,6 +431,15 @@ def test_test_ij():
     print(test.render())
 
 
+def test_test_parse_points():
+    points = TEST.parse_points(dict(model_type="ij", i=[0, 0], j=[10, 20]))
+    assert isinstance(points, IJ)
+    test = TEST(points=points, fname_par="integral_parameters.test")
+    assert test.points == points
+    with pytest.raises(ValidationError, match="Maximum of 50 points"):
+        TEST.parse_points(dict(model_type="ij", i=60 * [0], j=list(range(60))))
+
+
 def test_test_max50():
     with pytest.raises(ValidationError):
         TEST(
@@ -14,6 +14,7 @@ from rompy_swan.components.physics import (
     BRAGG,
     BRAGG_FILE,
     BRAGG_FT,
+    DIFFRACTION,
     GEN1,
     GEN2,
     GEN3,
@@ -22,17 +23,22 @@ from rompy_swan.components.physics import (
     OBSTACLE,
     OFF,
     OFFS,
+    QUADRUPL,
+    SCAT,
+    SETUP,
     SICE,
     SICE_D15,
     SICE_M18,
     SICE_R19,
     SICE_R21B,
+    SURFBEAT,
     TRIAD_DCTA,
     TRIAD_LTA,
     TRIAD_SPB,
     TURBULENCE,
     VEGETATION,
 )
+from rompy_swan.types import PhysicsOff
 
 
 # =====================================================================================
@@ -89,6 +95,22 @@ def test_gen3_default():
     assert phys.render() == f"GEN3 {phys.source_terms.render()}"
 
 
+def test_gen3_from_trusted():
+    phys = GEN3(source_terms=dict(model_type="komen", agrow=True))
+    trusted = GEN3.from_trusted(phys.source_terms)
+    assert trusted.source_terms is phys.source_terms
+    assert trusted.render() == phys.render()
+
+
+def test_quadrupl():
+    phys = QUADRUPL()
+    assert phys.render() == "QUADRUPL"
+    phys = QUADRUPL(iquad=2, lambd=0.25, cnl4=3.0e7, csh1=5.5, csh2=0.833333)
+    assert phys.render() == (
+        "QUADRUPL iquad=2 lambda=0.25 cnl4=30000000.0 csh1=5.5 csh2=0.833333"
+    )
+
+
 # =====================================================================================
 # TRIADS
 # =====================================================================================
@@ -117,6 +139,13 @@ def test_triad_spb():
     assert phys.render() == "TRIAD SPB trfac=0.9 a=0.95 b=0.0 BIPHASE DEWIT lpar=0.0"
 
 
+def test_triad_biphase_without_model_type():
+    phys = TRIAD_LTA(biphase={"urcrit": 0.63})
+    assert phys.render() == "TRIAD LTA BIPHASE ELDEBERKY urcrit=0.63"
+    phys = TRIAD_LTA(biphase={"lpar": 0.0})
+    assert phys.render() == "TRIAD LTA BIPHASE DEWIT lpar=0.0"
+
+
 # =====================================================================================
 # VEGETATION
 # =====================================================================================
@@ -279,6 +308,47 @@ def test_limiter():
     assert lim.render() == "LIMITER ursell=10.0 qb=1.0"
 
 
+# =====================================================================================
+# SETUP
+# =====================================================================================
+def test_setup():
+    assert SETUP().render() == "SETUP"
+    assert SETUP(supcor=0.5).render() == "SETUP supcor=0.5"
+
+
+# =====================================================================================
+# SURFBEAT
+# =====================================================================================
+def test_surfbeat():
+    assert SURFBEAT().render() == "SURFBEAT"
+    phys = SURFBEAT(df=0.01, nmax=50000, emin=0.05, spacing="logarithmic")
+    assert phys.render() == "SURFBEAT df=0.01 nmax=50000 emin=0.05 LOGARITHMIC"
+    assert SURFBEAT(spacing="uniform").render() == "SURFBEAT UNIFORM"
+
+
+# =====================================================================================
+# SCAT
+# =====================================================================================
+def test_scat():
+    assert SCAT().render() == "SCAT"
+    phys = SCAT(iqcm=2, rfac=1.0, alpha=1.0)
+    assert phys.render() == "SCAT iqcm=2 GRID rfac=1.0 TRUNC alpha=1.0"
+    phys = SCAT(qmax=0.5)
+    assert phys.render() == "SCAT TRUNC qmax=0.5"
+
+
+# =====================================================================================
+# DIFFRACTION
+# =====================================================================================
+def test_diffraction():
+    diff = DIFFRACTION()
+    assert diff.render() == "DIFFRACTION"
+    diff = DIFFRACTION(idiffr=True, smpar=0.0, smnum=1.0)
+    assert diff.render() == "DIFFRACTION idiffr=1 smpar=0.0 smnum=1"
+    diff = DIFFRACTION(idiffr=False)
+    assert diff.render() == "DIFFRACTION idiffr=0"
+
+
 # =====================================================================================
 # OBSTACLE
 # =====================================================================================
@@ -303,6 +373,12 @@ def test_off():
     assert off.render() == "OFF WINDGROWTH"
 
 
+@pytest.mark.parametrize("physics", list(PhysicsOff))
+def test_off_all_physics(physics):
+    off = OFF(physics=physics.value)
+    assert off.render() == f"OFF {physics.value.upper()}"
+
+
 def test_offs():
     offs = OFFS(offs=[OFF(physics="windgrowth"), OFF(physics="breaking")])
     print(offs.render())
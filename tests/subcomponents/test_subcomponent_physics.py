@@ -146,6 +146,7 @@ def test_trans1d():
 def test_trans2d():
     trans = TRANS2D(trcoef=[[0.0, 0.0, 0.0], [0.1, 0.1, 0.1]])
     assert "TRANS2D" in trans.render()
+    assert trans.render() == "TRANS2D &\n\t0.0 0.0 0.0 &\n\t0.1 0.1 0.1 &\n\t"
     "0.0 0.0 0.0" in trans.render()
     "0.1 0.1 0.1" in trans.render()
     with pytest.raises(ValidationError):
@@ -217,3 +218,10 @@ def test_freeboard_gamma_gt_0():
 def test_line():
     line = LINE(xp=[174.1, 174.2, 174.3], yp=[-39.1, -39.1, -39.1])
     assert [f"{x} {y}" in line.render() for x, y in zip(line.xp, line.yp)]
+
+
+def test_line_xp_yp_same_length():
+    with pytest.raises(ValidationError):
+        LINE(xp=[174.1, 174.2, 174.3], yp=[-39.1, -39.1])
+    with pytest.raises(ValidationError):
+        LINE(xp=(x for x in [174.1, 174.2, 174.3]), yp=[-39.1, -39.1])